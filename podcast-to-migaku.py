@@ -1,24 +1,38 @@
+from __future__ import annotations
+
 import os
 import sys
 import argparse
 from pathlib import Path
+from contextlib import ExitStack
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import shutil
 import logging
-from tqdm import tqdm
-import whisper
-import json
+import gc
+import functools
+import orjson
 import subprocess
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
-import psutil
-from PIL import Image
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
+
+# Heavy dependencies are imported where they are used so that --help and the
+# startup checks don't pay for loading CTranslate2 and numpy
+if TYPE_CHECKING:
+    import numpy as np
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
 
 @dataclass
 class Config:
     """Configuration class for podcast processing"""
-    model_size: str = 'large'  # Default to large for high quality
+    model_size: str = 'large-v3-turbo'  # Near large-v3 quality at a fraction of the decode cost
     language: str = 'ko'
+    device: str = 'auto'  # 'auto', 'cuda' or 'cpu'
+    compute_type: str = 'auto'  # CTranslate2 compute type, 'auto' picks per device
+    batch_size: int = 16  # Number of 30-second windows decoded per encoder batch
+    vad_min_silence_ms: int = 160  # Pauses at least this long split speech and are cut; lower skips more silence
+    video_encoder: str = 'auto'  # ffmpeg H.264 encoder, 'auto' prefers hardware encoders
+    cache_audio: bool = False  # Keep decoded 16kHz PCM next to the outputs for repeat runs
+    cpu_threads: Optional[int] = None  # CPU inference threads, None uses one per physical core
     output_formats: List[str] = None
     max_workers: int = 2
     verbose: bool = False
@@ -29,6 +43,21 @@ class Config:
 
 # Supported audio file extensions
 AUDIO_EXTS = ['.mp3', '.wav', '.m4a', '.aac', '.flac', '.ogg', '.mp4']
+AUDIO_EXT_SET = {ext.lower() for ext in AUDIO_EXTS}
+
+# Extensions that normally carry AAC audio, used when ffprobe is unavailable
+AAC_EXTS = {'.m4a', '.aac', '.mp4'}
+
+# Sample rate expected by Whisper models
+SAMPLE_RATE = 16000
+
+# H.264 encoders in order of preference, with encoder-specific options
+VIDEO_ENCODERS = {
+    'h264_nvenc': ['-preset', 'p1', '-pix_fmt', 'yuv420p'],
+    'h264_qsv': ['-preset', 'veryfast', '-pix_fmt', 'nv12'],
+    'h264_videotoolbox': ['-pix_fmt', 'yuv420p'],
+    'libx264': ['-tune', 'stillimage', '-pix_fmt', 'yuv420p'],
+}
 
 # Default paths
 BASE_DIR = Path(__file__).parent.resolve()
@@ -50,6 +79,8 @@ def setup_logging(verbose: bool = False) -> None:
 
 def check_system_requirements() -> Dict[str, bool]:
     """Check system requirements and available resources"""
+    import psutil
+    
     requirements = {
         'ffmpeg': shutil.which('ffmpeg') is not None,
         'disk_space': psutil.disk_usage(str(BASE_DIR)).free > 1_000_000_000,  # 1GB minimum
@@ -58,15 +89,81 @@ def check_system_requirements() -> Dict[str, bool]:
     }
     return requirements
 
+@functools.lru_cache(maxsize=None)
+def detect_video_encoder() -> str:
+    """Return the fastest H.264 encoder that works on this machine"""
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        available = result.stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.warning(f"Could not list ffmpeg encoders, using libx264: {e}")
+        return 'libx264'
+    
+    for encoder, options in VIDEO_ENCODERS.items():
+        if encoder == 'libx264' or encoder not in available:
+            continue
+        # An encoder can be compiled in without the matching hardware, so try a tiny encode
+        try:
+            probe = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=black:size=256x256:duration=0.1',
+                 '-c:v', encoder, *options, '-f', 'null', '-'],
+                capture_output=True,
+                timeout=30
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if probe.returncode == 0:
+            logging.info(f"Using hardware video encoder: {encoder}")
+            return encoder
+        logging.debug(f"Video encoder {encoder} is not usable on this machine")
+    
+    logging.info("No hardware video encoder available, using libx264")
+    return 'libx264'
+
 def validate_image_file(image_path: Path) -> bool:
-    """Validate that the image file is valid"""
+    """Validate that the image file is a JPEG, PNG or WebP by its header bytes"""
     try:
-        with Image.open(image_path) as img:
-            img.verify()
-        return True
-    except Exception as e:
+        with open(image_path, 'rb') as f:
+            head = f.read(12)
+    except OSError as e:
         logging.error(f"Invalid image file {image_path}: {e}")
         return False
+    
+    # ffmpeg decodes the image itself, so sniffing the format is enough here
+    if (head[:3] == b'\xff\xd8\xff'
+            or head[:8] == b'\x89PNG\r\n\x1a\n'
+            or (head[:4] == b'RIFF' and head[8:12] == b'WEBP')):
+        return True
+    
+    logging.error(f"Invalid image file {image_path}: not a JPEG, PNG or WebP image")
+    return False
+
+def select_compute_device(device: str = 'auto', compute_type: str = 'auto') -> Tuple[str, str]:
+    """Select the inference device and a compute type suited to its capabilities"""
+    import ctranslate2
+    
+    if device == 'auto':
+        device = 'cuda' if ctranslate2.get_cuda_device_count() > 0 else 'cpu'
+    
+    if compute_type == 'auto':
+        if device == 'cuda':
+            # CTranslate2 only reports float16 for GPUs with tensor cores (compute capability 7.0+),
+            # so Pascal and older cards fall through to int8 or float32
+            supported = ctranslate2.get_supported_compute_types('cuda')
+            compute_type = next(
+                (ct for ct in ('int8_float16', 'float16', 'int8') if ct in supported),
+                'float32'
+            )
+        else:
+            compute_type = 'int8'
+    
+    return device, compute_type
 
 class PodcastProcessor:
     """Simplified processor class for high-quality Whisper transcription"""
@@ -74,71 +171,98 @@ class PodcastProcessor:
     def __init__(self, config: Config, output_dir: Path):
         self.config = config
         self.output_dir = output_dir
-        self.model: Optional[whisper.Whisper] = None
+        self.model: Optional[WhisperModel] = None
+        self.pipeline: Optional[BatchedInferencePipeline] = None
+        # Subtitles, TXT and JSON share no state, so they are written concurrently
+        self.writer_pool = ThreadPoolExecutor(max_workers=3)
         self.output_dir.mkdir(exist_ok=True)
     
+    def close(self) -> None:
+        """Release the writer threads"""
+        self.writer_pool.shutdown(wait=True)
+    
     def load_model(self) -> bool:
         """Load Whisper model with error handling"""
         try:
+            from faster_whisper import WhisperModel, BatchedInferencePipeline
+            
             logging.info(f"Loading Whisper model ({self.config.model_size})...")
-            self.model = whisper.load_model(self.config.model_size)
+            device, compute_type = select_compute_device(self.config.device, self.config.compute_type)
+            logging.info(f"Using device: {device} (compute type: {compute_type})")
+            
+            cpu_threads = self.config.cpu_threads
+            if cpu_threads is None and device == 'cpu':
+                import psutil
+                # Hyperthreads compete for the same FP units, so one thread per physical core is faster
+                cpu_threads = psutil.cpu_count(logical=False)
+            logging.debug(f"Using {cpu_threads or 'default'} CPU threads")
+            
+            self.model = WhisperModel(
+                self.config.model_size,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads or 0
+            )
+            self.pipeline = BatchedInferencePipeline(model=self.model)
             logging.info("Model loaded successfully")
             return True
         except Exception as e:
             logging.error(f"Failed to load Whisper model: {e}")
             return False
     
-    def write_srt(self, segments: List[Dict], srt_path: Path) -> None:
-        """Write SRT subtitle file"""
-        try:
-            with open(srt_path, 'w', encoding='utf-8') as f:
-                for i, segment in enumerate(segments):
-                    start = segment['start']
-                    end = segment['end']
-                    text = segment['text'].strip()
-                    f.write(f"{i+1}\n")
-                    f.write(f"{self._format_srt_time(start)} --> {self._format_srt_time(end)}\n")
-                    f.write(f"{text}\n\n")
-            logging.info(f"SRT file written: {srt_path} ({len(segments)} segments)")
-        except Exception as e:
-            logging.error(f"Failed to write SRT file {srt_path}: {e}")
-            raise
-
-    def write_vtt(self, segments: List[Dict], vtt_path: Path) -> None:
-        """Write VTT subtitle file"""
+    def write_all_subtitles(self, segments: List[Dict], base_path: Path, formats: List[str]) -> None:
+        """Write SRT, VTT and TSV subtitle files in a single pass over the segments"""
+        formats = [fmt for fmt in ('srt', 'vtt', 'tsv') if fmt in formats]
+        if not formats:
+            return
+        
         try:
-            with open(vtt_path, 'w', encoding='utf-8') as f:
-                f.write("WEBVTT\n\n")
-                for segment in segments:
-                    start = self._format_vtt_time(segment['start'])
-                    end = self._format_vtt_time(segment['end'])
+            with ExitStack() as stack:
+                # Binary mode skips the text layer; each file is encoded and written in one call
+                files = {
+                    fmt: stack.enter_context(open(base_path.with_suffix(f'.{fmt}'), 'wb'))
+                    for fmt in formats
+                }
+                parts = {fmt: [] for fmt in formats}
+                srt = parts.get('srt')
+                vtt = parts.get('vtt')
+                tsv = parts.get('tsv')
+                
+                if vtt is not None:
+                    vtt.append("WEBVTT\n\n")
+                if tsv is not None:
+                    tsv.append("start\tend\ttext\n")
+                
+                for i, segment in enumerate(segments, 1):
+                    # Split each timestamp once and share it between SRT and VTT
+                    sh, sm, ss, sms = self._split_time(segment['start'])
+                    eh, em, es, ems = self._split_time(segment['end'])
+                    start = f"{sh:02}:{sm:02}:{ss:02}"
+                    end = f"{eh:02}:{em:02}:{es:02}"
                     text = segment['text'].strip()
-                    f.write(f"{start} --> {end}\n{text}\n\n")
-            logging.info(f"VTT file written: {vtt_path} ({len(segments)} segments)")
-        except Exception as e:
-            logging.error(f"Failed to write VTT file {vtt_path}: {e}")
-            raise
-
-    def write_tsv(self, segments: List[Dict], tsv_path: Path) -> None:
-        """Write TSV (Tab-Separated Values) subtitle file"""
-        try:
-            with open(tsv_path, 'w', encoding='utf-8') as f:
-                f.write("start\tend\ttext\n")
-                for segment in segments:
-                    start = f"{segment['start']:.3f}"
-                    end = f"{segment['end']:.3f}"
-                    text = segment['text'].strip().replace('\t', ' ').replace('\n', ' ')
-                    f.write(f"{start}\t{end}\t{text}\n")
-            logging.info(f"TSV file written: {tsv_path} ({len(segments)} segments)")
+                    
+                    if srt is not None:
+                        srt.append(f"{i}\n{start},{sms:03} --> {end},{ems:03}\n{text}\n\n")
+                    if vtt is not None:
+                        vtt.append(f"{start}.{sms:03} --> {end}.{ems:03}\n{text}\n\n")
+                    if tsv is not None:
+                        tsv_text = text.replace('\t', ' ').replace('\n', ' ')
+                        tsv.append(f"{segment['start']:.3f}\t{segment['end']:.3f}\t{tsv_text}\n")
+                
+                for fmt, f in files.items():
+                    f.write(''.join(parts[fmt]).encode('utf-8'))
+            
+            for fmt in formats:
+                logging.info(f"{fmt.upper()} file written: {base_path.with_suffix(f'.{fmt}')} ({len(segments)} segments)")
         except Exception as e:
-            logging.error(f"Failed to write TSV file {tsv_path}: {e}")
+            logging.error(f"Failed to write subtitle files for {base_path}: {e}")
             raise
 
     def write_txt(self, text: str, txt_path: Path) -> None:
         """Write plain text file"""
         try:
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write(text.strip() + '\n')
+            with open(txt_path, 'wb') as f:
+                f.write((text.strip() + '\n').encode('utf-8'))
             logging.info(f"TXT file written: {txt_path}")
         except Exception as e:
             logging.error(f"Failed to write TXT file {txt_path}: {e}")
@@ -147,83 +271,249 @@ class PodcastProcessor:
     def write_json(self, result: Dict[str, Any], json_path: Path) -> None:
         """Write JSON result file"""
         try:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             logging.info(f"JSON file written: {json_path}")
         except Exception as e:
             logging.error(f"Failed to write JSON file {json_path}: {e}")
             raise
 
-    def _format_srt_time(self, seconds: float) -> str:
-        """Format time for SRT format"""
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
-        ms = int((seconds - int(seconds)) * 1000)
-        return f"{h:02}:{m:02}:{s:02},{ms:03}"
-
-    def _format_vtt_time(self, seconds: float) -> str:
-        """Format time for VTT format"""
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
-        ms = int((seconds - int(seconds)) * 1000)
-        return f"{h:02}:{m:02}:{s:02}.{ms:03}"
+    def _split_time(self, seconds: float) -> Tuple[int, int, int, int]:
+        """Split seconds into (hours, minutes, seconds, milliseconds) using integer math"""
+        ms_total = int(seconds * 1000 + 0.5)
+        s_total, ms = divmod(ms_total, 1000)
+        m_total, s = divmod(s_total, 60)
+        h, m = divmod(m_total, 60)
+        return h, m, s, ms
+
+    def _build_result(self, segments, info) -> Dict[str, Any]:
+        """Materialize faster-whisper segments into a Whisper-style result dict"""
+        segment_dicts = [
+            {
+                'id': segment.id,
+                'seek': segment.seek,
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text,
+                'avg_logprob': segment.avg_logprob,
+                'compression_ratio': segment.compression_ratio,
+                'no_speech_prob': segment.no_speech_prob
+            }
+            for segment in segments
+        ]
+        return {
+            'text': ''.join(segment['text'] for segment in segment_dicts),
+            'segments': segment_dicts,
+            'language': info.language
+        }
+
+    def _load_cached_samples(self, audio_path: Path, pcm_path: Path) -> Optional[np.ndarray]:
+        """Load previously decoded int16 samples if they were made from the current source file"""
+        import numpy as np
+        
+        if not pcm_path.exists():
+            return None
+        
+        stat = audio_path.stat()
+        try:
+            with np.load(pcm_path) as cache:
+                if (int(cache['source_size']) != stat.st_size
+                        or int(cache['source_mtime_ns']) != stat.st_mtime_ns):
+                    logging.debug(f"Cached audio for {audio_path.name} is out of date, decoding again")
+                    return None
+                samples = cache['samples']
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable cached audio for {audio_path.name}: {e}")
+            return None
+        
+        if samples.dtype != np.int16 or samples.ndim != 1 or not len(samples):
+            logging.warning(f"Ignoring implausible cached audio for {audio_path.name}")
+            return None
+        
+        logging.debug(f"Loaded cached audio for {audio_path.name}")
+        return samples
+
+    def _load_audio(self, audio_path: Path) -> np.ndarray:
+        """Decode audio to 16kHz mono float32 samples in a single ffmpeg pass"""
+        import numpy as np
+        
+        # Decoded samples don't depend on the model or language, so sweeps can reuse them
+        pcm_path = self.output_dir / f"{audio_path.stem}.pcm.npz"
+        samples = self._load_cached_samples(audio_path, pcm_path) if self.config.cache_audio else None
+        
+        if samples is None:
+            cmd = [
+                'ffmpeg', '-nostdin',
+                '-loglevel', 'error',
+                '-i', str(audio_path),
+                '-ac', '1',
+                '-ar', str(SAMPLE_RATE),
+                '-f', 's16le',
+                '-'
+            ]
+            result = subprocess.run(
+                cmd,
+                check=True,
+                capture_output=True,
+                timeout=3600  # 1 hour timeout
+            )
+            samples = np.frombuffer(result.stdout, np.int16)
+            if self.config.cache_audio:
+                # int16 keeps the cache at half the size of the float32 samples, and the
+                # source size and mtime let later runs tell whether it is still current
+                stat = audio_path.stat()
+                np.savez(pcm_path, samples=samples,
+                         source_size=stat.st_size, source_mtime_ns=stat.st_mtime_ns)
+        
+        audio = samples.astype(np.float32) / 32768.0
+        logging.debug(f"Decoded {audio_path.name}: {len(audio) / SAMPLE_RATE:.1f}s of audio")
+        return audio
+
+    def _source_fingerprint(self, audio_path: Path) -> Dict[str, Any]:
+        """Identify the source audio and the settings that affect its transcription"""
+        stat = audio_path.stat()
+        return {
+            'source': audio_path.name,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'model': self.config.model_size,
+            'language': self.config.language,
+            'vad_min_silence_ms': self.config.vad_min_silence_ms
+        }
+
+    def _load_cached_result(self, audio_path: Path, base_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a previous JSON result if its manifest still matches the source audio"""
+        json_path = base_path.with_suffix('.json')
+        manifest_path = base_path.with_suffix('.manifest.json')
+        if not (json_path.exists() and manifest_path.exists()):
+            return None
+        
+        try:
+            if orjson.loads(manifest_path.read_bytes()) != self._source_fingerprint(audio_path):
+                logging.info(f"Cached transcription for {audio_path.name} is out of date, re-transcribing")
+                return None
+            return orjson.loads(json_path.read_bytes())
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable cached transcription for {audio_path.name}: {e}")
+            return None
+
+    def _transcribe(self, audio_path: Path) -> Dict[str, Any]:
+        """Run Whisper on an audio file and return a Whisper-style result dict"""
+        logging.info(f"Transcribing {audio_path.name}...")
+        
+        audio = self._load_audio(audio_path)
+        
+        # Speech regions are grouped into 30-second windows and decoded in batches
+        segments, info = self.pipeline.transcribe(
+            audio,
+            language=self.config.language,
+            batch_size=self.config.batch_size,
+            # Silero VAD drops silence, intros and outros before they reach the encoder
+            vad_filter=True,
+            # 160 ms matches the batched pipeline's own default; passing a dict replaces it
+            vad_parameters=dict(min_silence_duration_ms=self.config.vad_min_silence_ms),
+            beam_size=5,
+            word_timestamps=False
+        )
+        
+        # transcribe() returns a lazy generator; the model only runs as it is consumed
+        return self._build_result(segments, info)
 
     def generate_subtitles(self, audio_path: Path) -> bool:
         """Generate high-quality subtitles for audio file"""
-        if not self.model:
+        if not self.pipeline:
             logging.error("Whisper model not loaded")
             return False
         
         try:
-            logging.info(f"Transcribing {audio_path.name}...")
-            
-            # Simple, reliable transcription settings
-            result = self.model.transcribe(
-                str(audio_path),
-                language=self.config.language,
-                verbose=False,  # Disable verbose output to prevent spam
-                word_timestamps=False
-                # Removed beam_size, best_of, patience, and temperature 
-                # as they can cause repetition loops with certain audio
-            )
-            
             base_path = self.output_dir / audio_path.stem
+            formats = self.config.output_formats
             
+            # Resume interrupted batches from the JSON output instead of re-running Whisper
+            result = self._load_cached_result(audio_path, base_path) if 'json' in formats else None
+            cached = result is not None
+            if cached:
+                logging.info(f"Using cached transcription for {audio_path.name}")
+            else:
+                # A stale manifest must not vouch for a JSON file that is about to be rewritten
+                if 'json' in formats:
+                    base_path.with_suffix('.manifest.json').unlink(missing_ok=True)
+                result = self._transcribe(audio_path)
+
             # Write all requested formats
-            if 'srt' in self.config.output_formats:
-                self.write_srt(result['segments'], base_path.with_suffix('.srt'))
-            if 'vtt' in self.config.output_formats:
-                self.write_vtt(result['segments'], base_path.with_suffix('.vtt'))
-            if 'tsv' in self.config.output_formats:
-                self.write_tsv(result['segments'], base_path.with_suffix('.tsv'))
-            if 'txt' in self.config.output_formats:
-                self.write_txt(result['text'], base_path.with_suffix('.txt'))
-            if 'json' in self.config.output_formats:
-                self.write_json(result, base_path.with_suffix('.json'))
+            tasks = [(self.write_all_subtitles, (result['segments'], base_path, formats))]
+            if 'txt' in formats:
+                tasks.append((self.write_txt, (result['text'], base_path.with_suffix('.txt'))))
+            if 'json' in formats and not cached:
+                tasks.append((self.write_json, (result, base_path.with_suffix('.json'))))
+            list(self.writer_pool.map(lambda task: task[0](*task[1]), tasks))
+            
+            # Only record the manifest once the JSON it describes is complete
+            if 'json' in formats and not cached:
+                manifest = self._source_fingerprint(audio_path)
+                base_path.with_suffix('.manifest.json').write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
             
             logging.info(f"Subtitles for {audio_path.name} completed successfully")
             return True
             
+        except subprocess.TimeoutExpired:
+            logging.error(f"FFmpeg timeout decoding {audio_path}")
+            return False
+        except subprocess.CalledProcessError as e:
+            logging.error(f"FFmpeg failed to decode {audio_path}: {e.stderr.decode('utf-8', errors='replace')}")
+            return False
         except Exception as e:
             logging.error(f"Failed to generate subtitles for {audio_path}: {e}")
             return False
 
-    def _build_ffmpeg_command(self, audio_path: Path, image_path: Path, output_mkv: Path) -> List[str]:
+    def _is_aac_audio(self, audio_path: Path) -> bool:
+        """Check whether the audio stream is already AAC"""
+        if shutil.which('ffprobe'):
+            try:
+                result = subprocess.run(
+                    ['ffprobe', '-v', 'error',
+                     '-select_streams', 'a:0',
+                     '-show_entries', 'stream=codec_name',
+                     '-of', 'default=noprint_wrappers=1:nokey=1',
+                     str(audio_path)],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
+                if result.returncode == 0 and result.stdout.strip():
+                    return result.stdout.strip() == 'aac'
+            except (OSError, subprocess.SubprocessError) as e:
+                logging.debug(f"ffprobe failed for {audio_path.name}: {e}")
+        return audio_path.suffix.lower() in AAC_EXTS
+
+    def _build_ffmpeg_command(self, audio_path: Path, image_path: Path, output_mkv: Path,
+                              copy_audio: bool = False) -> List[str]:
         """Build ffmpeg command for video conversion"""
+        encoder = self.config.video_encoder
+        if encoder == 'auto':
+            encoder = detect_video_encoder()
+        
+        # AAC sources are stream-copied instead of being re-encoded
+        audio_codec = ['-c:a', 'copy'] if copy_audio else ['-c:a', 'aac', '-b:a', '192k']
+        
         return [
             'ffmpeg', '-y',
+            # Background encodes must not touch the terminal's mode or read its keypresses
+            '-nostdin',
+            # Only errors reach stderr, so an hour of progress lines is never buffered
+            '-hide_banner', '-loglevel', 'error', '-nostats',
+            # The background never changes, so one frame per second is plenty
+            '-framerate', '1',
             '-loop', '1',
             '-i', str(image_path),
             '-i', str(audio_path),
             '-vf', 'scale=1080:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2',
-            '-c:v', 'libx264',
-            '-tune', 'stillimage',
-            '-c:a', 'aac',
-            '-b:a', '192k',
-            '-pix_fmt', 'yuv420p',
+            '-c:v', encoder,
+            *VIDEO_ENCODERS[encoder],
+            '-g', '10',  # Keyframe every 10 seconds keeps seeking responsive
+            *audio_codec,
             '-shortest',
+            '-r', '1',
             str(output_mkv)
         ]
 
@@ -231,15 +521,23 @@ class PodcastProcessor:
         """Convert audio to MKV video with background image"""
         try:
             logging.info(f"Converting {audio_path.name} to video...")
-            cmd = self._build_ffmpeg_command(audio_path, image_path, output_mkv)
+            copy_audio = self._is_aac_audio(audio_path)
+            if copy_audio:
+                logging.debug(f"{audio_path.name} is already AAC, copying audio stream")
+            # Encode under a temporary name so an interrupted run never leaves a
+            # truncated video that a later run would mistake for a finished one
+            partial_mkv = output_mkv.with_suffix('.partial.mkv')
+            cmd = self._build_ffmpeg_command(audio_path, image_path, partial_mkv, copy_audio)
             
-            result = subprocess.run(
+            subprocess.run(
                 cmd, 
                 check=True, 
-                capture_output=True, 
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=3600  # 1 hour timeout
             )
+            partial_mkv.replace(output_mkv)
             
             logging.info(f"Video saved: {output_mkv.name}")
             return True
@@ -253,6 +551,8 @@ class PodcastProcessor:
         except Exception as e:
             logging.error(f"Unexpected error converting {audio_path}: {e}")
             return False
+        finally:
+            output_mkv.with_suffix('.partial.mkv').unlink(missing_ok=True)
 
     def move_processed_file(self, file_path: Path) -> bool:
         """Move processed audio file to complete directory"""
@@ -271,11 +571,12 @@ class PodcastProcessor:
 
 def find_audio_files(directory: Path) -> List[Path]:
     """Find all audio files in directory"""
-    audio_files = []
-    for ext in AUDIO_EXTS:
-        audio_files.extend(directory.glob(f"*{ext}"))
-        audio_files.extend(directory.glob(f"*{ext.upper()}"))
-    return sorted(audio_files)
+    # A single directory scan with case-insensitive extension matching
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path) for entry in entries
+            if entry.is_file() and Path(entry.name).suffix.lower() in AUDIO_EXT_SET
+        )
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments"""
@@ -286,8 +587,8 @@ def parse_arguments() -> argparse.Namespace:
     
     parser.add_argument(
         '--model', '-m',
-        choices=['tiny', 'base', 'small', 'medium', 'large'],
-        default='large',
+        choices=['tiny', 'base', 'small', 'medium', 'large', 'large-v3', 'large-v3-turbo', 'distil-large-v3'],
+        default='large-v3-turbo',
         help='Whisper model size (larger = better quality)'
     )
     
@@ -297,6 +598,46 @@ def parse_arguments() -> argparse.Namespace:
         help='Language code for transcription'
     )
     
+    parser.add_argument(
+        '--device', '-d',
+        choices=['auto', 'cuda', 'cpu'],
+        default='auto',
+        help='Inference device (auto uses CUDA when a GPU is available)'
+    )
+    
+    parser.add_argument(
+        '--compute-type',
+        default='auto',
+        help='CTranslate2 compute type, e.g. float16, int8_float16, int8 (auto picks based on GPU capability)'
+    )
+    
+    parser.add_argument(
+        '--batch-size', '-b',
+        type=int,
+        default=16,
+        help='Number of audio windows transcribed per batch (lower if you run out of GPU memory)'
+    )
+    
+    parser.add_argument(
+        '--vad-min-silence',
+        type=int,
+        default=160,
+        help='Shortest pause in milliseconds that voice activity detection cuts out (lower skips more silence)'
+    )
+    
+    parser.add_argument(
+        '--video-encoder',
+        choices=['auto', *VIDEO_ENCODERS],
+        default='auto',
+        help='H.264 encoder for video generation (auto prefers NVENC, QSV or VideoToolbox when available)'
+    )
+    
+    parser.add_argument(
+        '--cache-audio',
+        action='store_true',
+        help='Keep decoded 16kHz audio in the output directory so re-runs with other models skip decoding'
+    )
+    
     parser.add_argument(
         '--formats', '-f',
         nargs='+',
@@ -334,37 +675,73 @@ def parse_arguments() -> argparse.Namespace:
     
     return parser.parse_args()
 
+def _finish_file(processor: PodcastProcessor, file_path: Path, subtitle_success: bool,
+                 video_success: bool, stats: Dict[str, int]) -> None:
+    """Move processed file if both operations succeeded and update stats"""
+    if subtitle_success and video_success:
+        moved = processor.move_processed_file(file_path)
+        stats['success'] += 1
+        if moved:
+            stats['moved'] += 1
+    else:
+        stats['failed'] += 1
+
+def _finish_encodes(processor: PodcastProcessor, pending: Dict[Any, Tuple[Path, bool]],
+                    futures: List[Any], stats: Dict[str, int]) -> None:
+    """Finish the files whose video encodes have completed and drop them from pending"""
+    for future in futures:
+        file_path, subtitle_success = pending.pop(future)
+        try:
+            _finish_file(processor, file_path, subtitle_success, future.result(), stats)
+        except Exception as e:
+            logging.error(f"Failed to process {file_path}: {e}")
+            stats['failed'] += 1
+
 def process_files(processor: PodcastProcessor, files: List[Path], image_path: Path) -> Dict[str, int]:
-    """Process files sequentially for best quality"""
+    """Transcribe files sequentially while their videos are encoded in the background"""
+    from tqdm import tqdm
+    
     stats = {'success': 0, 'failed': 0, 'moved': 0}
     
-    for file_path in tqdm(files, desc="Processing files"):
+    # ffmpeg encoding is CPU-bound and Whisper is mostly GPU-bound, so each file's
+    # video is encoded while the next file is being transcribed
+    with ThreadPoolExecutor(max_workers=processor.config.max_workers) as executor:
+        pending = {}
+        
         try:
-            # Generate subtitles
-            subtitle_success = processor.generate_subtitles(file_path)
-            
-            # Convert to video
-            mkv_path = processor.output_dir / f"{file_path.stem}.mkv"
-            video_success = False
-            
-            if not mkv_path.exists():
-                video_success = processor.convert_audio_to_mkv(file_path, image_path, mkv_path)
-            else:
-                logging.info(f"Video for {file_path.name} already exists, skipping")
-                video_success = True
-            
-            # Move processed file if both operations succeeded
-            if subtitle_success and video_success:
-                moved = processor.move_processed_file(file_path)
-                stats['success'] += 1
-                if moved:
-                    stats['moved'] += 1
-            else:
-                stats['failed'] += 1
+            for file_path in tqdm(files, desc="Processing files"):
+                try:
+                    # Generate subtitles
+                    subtitle_success = processor.generate_subtitles(file_path)
+                    
+                    # Convert to video
+                    mkv_path = processor.output_dir / f"{file_path.stem}.mkv"
+                    
+                    if not mkv_path.exists():
+                        future = executor.submit(processor.convert_audio_to_mkv, file_path, image_path, mkv_path)
+                        pending[future] = (file_path, subtitle_success)
+                    else:
+                        logging.info(f"Video for {file_path.name} already exists, skipping")
+                        _finish_file(processor, file_path, subtitle_success, True, stats)
+                        
+                except Exception as e:
+                    logging.error(f"Failed to process {file_path}: {e}")
+                    stats['failed'] += 1
+                finally:
+                    # Release the previous transcription's segment lists before starting the next file
+                    gc.collect()
                 
-        except Exception as e:
-            logging.error(f"Failed to process {file_path}: {e}")
-            stats['failed'] += 1
+                # Move files whose videos finished while this one was being transcribed
+                _finish_encodes(processor, pending, [f for f in pending if f.done()], stats)
+            
+            for future in as_completed(list(pending)):
+                _finish_encodes(processor, pending, [future], stats)
+        except KeyboardInterrupt:
+            # Queued encodes would otherwise still run once the executor exits; the
+            # in-flight ffmpeg got the same SIGINT, so waiting for it is short
+            executor.shutdown(wait=True, cancel_futures=True)
+            _finish_encodes(processor, pending, [f for f in pending if not f.cancelled()], stats)
+            raise
     
     return stats
 
@@ -414,10 +791,21 @@ def main():
     config = Config(
         model_size=args.model,
         language=args.language,
+        device=args.device,
+        compute_type=args.compute_type,
+        batch_size=args.batch_size,
+        vad_min_silence_ms=args.vad_min_silence,
+        video_encoder=args.video_encoder,
+        cache_audio=args.cache_audio,
         output_formats=args.formats,
         verbose=args.verbose
     )
     
+    # CTranslate2 reads this when it first allocates GPU memory; the stream-ordered
+    # allocator returns freed blocks to the driver pool instead of fragmenting a
+    # private cache over hours of batch processing
+    os.environ.setdefault('CT2_CUDA_ALLOCATOR', 'cuda_malloc_async')
+    
     processor = PodcastProcessor(config, args.output_dir)
     
     # Load Whisper model
@@ -443,6 +831,8 @@ def main():
     except Exception as e:
         logging.error(f"Unexpected error: {e}")
         return 1
+    finally:
+        processor.close()
 
 if __name__ == '__main__':
     sys.exit(main())
\ No newline at end of file
@@ -89,8 +89,8 @@ def main():
     print("=" * 40)
     
     # Check Python version
-    if sys.version_info < (3, 8):
-        print("❌ Error: Python 3.8+ is required")
+    if sys.version_info < (3, 9):
+        print("❌ Error: Python 3.9+ is required")
         sys.exit(1)
     
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")